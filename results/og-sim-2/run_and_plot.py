@@ -5,29 +5,55 @@ Topology: 1 server → 5 routers → 15 receivers (heterogeneous paths)
 Comparing TcpLinuxReno vs TcpFast
 """
 
+import concurrent.futures
 import subprocess
-import csv
 import os
 import sys
-import time
 
-# Check for matplotlib
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    print("Warning: matplotlib not found. Plots will not be generated.")
-    print("Install with: pip3 install matplotlib numpy")
+import numpy as np
+import pandas as pd
+
+# matplotlib is imported lazily by load_matplotlib() so that runs which only
+# print the summary don't pay for its import and font cache setup
+HAS_MATPLOTLIB = None
+plt = None
 
 TCP_VARIANTS = ["LinuxReno", "Fast"]
 SIMULATION_TIME = 60  # Longer for high-delay network
 OUTPUT_DIR = "results/og-sim-2/"
+PLOT_DPI = 150
+PNG_PIL_KWARGS = {'compress_level': 1}  # Fast zlib level; files are ~15% larger
 
 # Get the ns-3 root directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 NS3_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+OUT_PREFIX = os.path.normpath(os.path.join(NS3_ROOT, OUTPUT_DIR))
+
+# Shared plotting helpers live in results/, one level up from this script
+sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+from plot_common import decimate_trace, setup_matplotlib
+
+def load_matplotlib():
+    """Import matplotlib on first use; return whether it is available"""
+    global HAS_MATPLOTLIB, plt
+    if HAS_MATPLOTLIB is None:
+        try:
+            plt = setup_matplotlib()
+            HAS_MATPLOTLIB = True
+        except ImportError:
+            HAS_MATPLOTLIB = False
+            print("Warning: matplotlib not found. Plots will not be generated.")
+            print("Install with: pip3 install matplotlib")
+    return HAS_MATPLOTLIB
+
+def build_simulation():
+    """Build og-sim-2 once so parallel runs don't race on the build tree"""
+    try:
+        subprocess.run(["./ns3", "build", "og-sim-2"], cwd=NS3_ROOT, check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"\n✗ Build failed with exit code {e.returncode}")
+        return False
 
 def run_simulation(tcp_variant, sim_time):
     """Run a single simulation"""
@@ -35,30 +61,34 @@ def run_simulation(tcp_variant, sim_time):
     print(f"Running simulation for {tcp_variant}...")
     print(f"{'='*80}\n")
     
-    # Change to ns-3 root directory
-    os.chdir(NS3_ROOT)
-    
+    # Program arguments go after "--" as separate argv entries so ns3 hands
+    # them to og-sim-2 without re-splitting a joined string
     cmd = [
-        "./ns3", "run",
-        f"og-sim-2 --tcpVariant={tcp_variant} --simulationTime={sim_time}"
+        "./ns3", "run", "--no-build", "og-sim-2", "--",
+        f"--tcpVariant={tcp_variant}", f"--simulationTime={sim_time}"
     ]
     
     try:
         result = subprocess.run(
             cmd,
+            cwd=NS3_ROOT,
             check=True,
             timeout=300,  # 5 minute timeout
-            text=True
+            text=True,
+            # Results come from the CSVs; only keep stderr to report failures
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
         
         print(f"\n✓ {tcp_variant} completed successfully")
-        time.sleep(1)
         return True
     except subprocess.TimeoutExpired:
         print(f"\n✗ {tcp_variant} timeout")
         return False
     except subprocess.CalledProcessError as e:
         print(f"\n✗ {tcp_variant} failed with exit code {e.returncode}")
+        if e.stderr:
+            print(e.stderr)
         return False
     except Exception as e:
         print(f"\n✗ {tcp_variant} exception: {e}")
@@ -67,42 +97,48 @@ def run_simulation(tcp_variant, sim_time):
 def parse_csv(filename):
     """Parse aggregate CSV results file"""
     try:
-        with open(filename, 'r') as f:
-            reader = csv.DictReader(f)
-            row = next(reader)
-            return {
-                'variant': row['TCP_Variant'],
-                'total_throughput': float(row['Total_Throughput_Mbps']),
-                'avg_throughput': float(row['Avg_Throughput_Per_Flow_Mbps']),
-                'avg_delay': float(row['Avg_Delay_ms']),
-                'total_lost': int(float(row['Total_Lost_Packets'])),
-                'loss_rate': float(row['Loss_Rate_Percent']),
-                'num_flows': int(float(row['Num_Flows']))
-            }
+        row = pd.read_csv(filename, nrows=1).iloc[0]
+        return {
+            'variant': row['TCP_Variant'],
+            'total_throughput': float(row['Total_Throughput_Mbps']),
+            'avg_throughput': float(row['Avg_Throughput_Per_Flow_Mbps']),
+            'avg_delay': float(row['Avg_Delay_ms']),
+            'total_lost': int(row['Total_Lost_Packets']),
+            'loss_rate': float(row['Loss_Rate_Percent']),
+            'num_flows': int(row['Num_Flows'])
+        }
     except Exception as e:
         print(f"Error parsing {filename}: {e}")
         return None
 
 def parse_perflow_csv(filename):
-    """Parse per-flow CSV results file"""
+    """Parse per-flow CSV results file into a DataFrame indexed by Flow_ID"""
     try:
-        flows = []
-        with open(filename, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                flows.append({
-                    'flow_id': int(row['Flow_ID']),
-                    'throughput': float(row['Throughput_Mbps']),
-                    'delay': float(row['Delay_ms'])
-                })
-        return flows
+        return pd.read_csv(filename, usecols=['Flow_ID', 'Throughput_Mbps', 'Delay_ms'],
+                           dtype={'Flow_ID': 'int32',
+                                  'Throughput_Mbps': 'float64',
+                                  'Delay_ms': 'float64'}).set_index('Flow_ID')
     except Exception as e:
         print(f"Error parsing {filename}: {e}")
         return None
 
-def generate_cwnd_plots(variants):
-    """Generate congestion window plots - one image per variant"""
-    if not HAS_MATPLOTLIB:
+def load_cwnd_csv(filename):
+    """Load a cwnd trace CSV as (times, cwnds) arrays, cwnd in segments"""
+    # memory_map lets the C parser read straight from the page cache, which
+    # keeps repeated --skip-sim re-plots of long traces cheap.
+    df = pd.read_csv(filename, usecols=['Time', 'CongestionWindow'],
+                     dtype={'Time': 'float64', 'CongestionWindow': 'float64'},
+                     memory_map=True)
+    times = df['Time'].to_numpy()
+    cwnds = df['CongestionWindow'].to_numpy() * (1.0 / 1400.0)  # Convert to segments
+    return times, cwnds
+
+def generate_cwnd_plots(variants, existing):
+    """Generate congestion window plots - one image per variant
+
+    existing is the set of file names present in OUT_PREFIX.
+    """
+    if not load_matplotlib():
         print("Skipping cwnd plots (matplotlib not available)")
         return
     
@@ -110,31 +146,30 @@ def generate_cwnd_plots(variants):
     
     colors = ['#e74c3c', '#3498db', '#2ecc71']
     flow_labels = ['Flow 1 (1Mbps/50ms)', 'Flow 2 (2Mbps/25ms)', 'Flow 3 (3Mbps/16ms)']
+    # One figure is reused for every variant; only the axes contents change
+    fig, axes = plt.subplots(3, 1, figsize=(12, 10))
+    # Fixed margins instead of tight_layout/bbox_inches='tight', which
+    # would lay out and render the figure a second time
+    fig.subplots_adjust(left=0.08, right=0.97, bottom=0.06, top=0.93, hspace=0.35)
     
     for variant in variants:
-        # Create figure with 3 subplots for this variant
-        fig, axes = plt.subplots(3, 1, figsize=(12, 10))
+        for ax in axes:
+            ax.clear()
         fig.suptitle(f'Congestion Window Evolution: TCP {variant}',
                      fontsize=14, fontweight='bold')
         
         for flow_idx in range(3):
             ax = axes[flow_idx]
-            cwnd_file = os.path.join(NS3_ROOT, OUTPUT_DIR, f"{variant}_cwnd_flow{flow_idx + 1}.csv")
+            cwnd_name = f"{variant}_cwnd_flow{flow_idx + 1}.csv"
+            cwnd_file = f"{OUT_PREFIX}/{cwnd_name}"
             
-            if os.path.exists(cwnd_file):
+            if cwnd_name in existing:
                 try:
-                    with open(cwnd_file, 'r') as f:
-                        reader = csv.DictReader(f)
-                        times = []
-                        cwnds = []
-                        
-                        for row in reader:
-                            times.append(float(row['Time']))
-                            cwnds.append(int(row['CongestionWindow']) / 1400)  # Convert to segments
-                        
-                        if times and cwnds:
-                            ax.plot(times, cwnds, label=f'TCP {variant}', 
-                                   color=colors[flow_idx], linewidth=1.5, alpha=0.8)
+                    times, cwnds = decimate_trace(*load_cwnd_csv(cwnd_file))
+                    if len(times):
+                        ax.plot(times, cwnds, label=f'TCP {variant}', 
+                               color=colors[flow_idx], linewidth=1.5, alpha=0.8,
+                               rasterized=True)
                 except Exception as e:
                     print(f"  Warning: Error reading {cwnd_file}: {e}")
             else:
@@ -149,17 +184,16 @@ def generate_cwnd_plots(variants):
             if flow_idx == 2:
                 ax.set_xlabel('Time (seconds)', fontsize=10, fontweight='bold')
         
-        plt.tight_layout()
-        
         # Save plot
-        plot_file = os.path.join(NS3_ROOT, OUTPUT_DIR, f"TCP{variant}_cwnd_progress.png")
-        plt.savefig(plot_file, dpi=300, bbox_inches='tight')
+        plot_file = f"{OUT_PREFIX}/TCP{variant}_cwnd_progress.png"
+        fig.savefig(plot_file, dpi=PLOT_DPI, pil_kwargs=PNG_PIL_KWARGS)
         print(f"✓ Saved CWND plot: {plot_file}")
-        plt.close()
+    
+    plt.close(fig)
 
 def generate_perflow_comparison_plots(perflow_data):
     """Generate per-flow throughput and delay comparison plots (only flows 1, 2, 3)"""
-    if not HAS_MATPLOTLIB:
+    if not load_matplotlib():
         print("Skipping per-flow plots (matplotlib not available)")
         return
     
@@ -174,71 +208,73 @@ def generate_perflow_comparison_plots(perflow_data):
     x = np.arange(len(flow_indices))
     width = 0.35
     
+    # (n_variants, n_flows) arrays, one row per variant
+    throughputs = np.array([perflow_data[v]['Throughput_Mbps'].iloc[flow_indices].to_numpy()
+                            for v in variants])
+    delays = np.array([perflow_data[v]['Delay_ms'].iloc[flow_indices].to_numpy()
+                       for v in variants])
+    
+    # Both plots are drawn on the same figure, cleared in between
+    fig, ax = plt.subplots(figsize=(10, 6))
+    fig.subplots_adjust(left=0.09, right=0.97, bottom=0.16, top=0.90)
+    
     # Plot 1: Throughput comparison (separate image)
-    fig1, ax1 = plt.subplots(figsize=(10, 6))
-    fig1.suptitle('Throughput Comparison: TCP LinuxReno vs TCP FAST', 
-                  fontsize=14, fontweight='bold')
+    fig.suptitle('Throughput Comparison: TCP LinuxReno vs TCP FAST', 
+                 fontsize=14, fontweight='bold')
     
     for i, variant in enumerate(variants):
-        throughputs = [perflow_data[variant][idx]['throughput'] for idx in flow_indices]
         offset = width * (i - 0.5)
-        bars = ax1.bar(x + offset, throughputs, width, label=f'TCP {variant}',
-                       color=colors[variant], alpha=0.8, edgecolor='black', linewidth=1.5)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.3f}',
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    ax1.set_xlabel('Flow', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Throughput (Mbps)', fontsize=12, fontweight='bold')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(flow_labels, fontsize=10)
-    ax1.legend(fontsize=11, loc='upper right')
-    ax1.grid(True, alpha=0.3, axis='y')
-    
-    plt.tight_layout()
-    plot_file1 = os.path.join(NS3_ROOT, OUTPUT_DIR, "throughput_comparison_flows.png")
-    plt.savefig(plot_file1, dpi=300, bbox_inches='tight')
+        bars = ax.bar(x + offset, throughputs[i], width, label=f'TCP {variant}',
+                      color=colors[variant], alpha=0.8, edgecolor='black', linewidth=1.5)
+        ax.bar_label(bars, fmt='%.3f', fontsize=10, fontweight='bold')
+    
+    ax.set_xlabel('Flow', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Throughput (Mbps)', fontsize=12, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(flow_labels, fontsize=10)
+    ax.legend(fontsize=11, loc='upper right')
+    ax.grid(True, alpha=0.3, axis='y')
+    
+    plot_file1 = f"{OUT_PREFIX}/throughput_comparison_flows.png"
+    fig.savefig(plot_file1, dpi=PLOT_DPI, pil_kwargs=PNG_PIL_KWARGS)
     print(f"✓ Saved throughput comparison: {plot_file1}")
-    plt.close()
     
     # Plot 2: Delay comparison (separate image)
-    fig2, ax2 = plt.subplots(figsize=(10, 6))
-    fig2.suptitle('Average Delay Comparison: TCP LinuxReno vs TCP FAST', 
-                  fontsize=14, fontweight='bold')
+    ax.clear()
+    fig.suptitle('Average Delay Comparison: TCP LinuxReno vs TCP FAST', 
+                 fontsize=14, fontweight='bold')
     
     for i, variant in enumerate(variants):
-        delays = [perflow_data[variant][idx]['delay'] for idx in flow_indices]
         offset = width * (i - 0.5)
-        bars = ax2.bar(x + offset, delays, width, label=f'TCP {variant}',
-                       color=colors[variant], alpha=0.8, edgecolor='black', linewidth=1.5)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}',
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    ax2.set_xlabel('Flow', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Average Delay (ms)', fontsize=12, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(flow_labels, fontsize=10)
-    ax2.legend(fontsize=11, loc='upper right')
-    ax2.grid(True, alpha=0.3, axis='y')
-    
-    plt.tight_layout()
-    plot_file2 = os.path.join(NS3_ROOT, OUTPUT_DIR, "delay_comparison_flows.png")
-    plt.savefig(plot_file2, dpi=300, bbox_inches='tight')
+        bars = ax.bar(x + offset, delays[i], width, label=f'TCP {variant}',
+                      color=colors[variant], alpha=0.8, edgecolor='black', linewidth=1.5)
+        ax.bar_label(bars, fmt='%.1f', fontsize=10, fontweight='bold')
+    
+    ax.set_xlabel('Flow', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Average Delay (ms)', fontsize=12, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(flow_labels, fontsize=10)
+    ax.legend(fontsize=11, loc='upper right')
+    ax.grid(True, alpha=0.3, axis='y')
+    
+    plot_file2 = f"{OUT_PREFIX}/delay_comparison_flows.png"
+    fig.savefig(plot_file2, dpi=PLOT_DPI, pil_kwargs=PNG_PIL_KWARGS)
     print(f"✓ Saved delay comparison: {plot_file2}")
-    plt.close()
+    plt.close(fig)
+
+def _bar_panel(ax, x_pos, values, colors, tick_labels, ylabel, title, fmt):
+    """Draw one labelled bar panel of the aggregate comparison figure"""
+    bars = ax.bar(x_pos, values, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+    ax.set_ylabel(ylabel, fontsize=11, fontweight='bold')
+    ax.set_title(title, fontsize=12, fontweight='bold')
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(tick_labels, fontsize=10)
+    ax.grid(True, alpha=0.3, axis='y')
+    ax.bar_label(bars, labels=[fmt % v for v in values], fontsize=10, fontweight='bold')
 
 def generate_aggregate_plots(results):
     """Generate aggregate comparison plots (3 plots: total throughput, avg delay, loss rate)"""
-    if not HAS_MATPLOTLIB:
+    if not load_matplotlib():
         print("Skipping aggregate plots (matplotlib not available)")
         return
     
@@ -270,56 +306,20 @@ def generate_aggregate_plots(results):
     bar_colors = [colors[v] for v in variants]
     x_pos = np.arange(len(variants))
     
-    # Plot 1: Total Throughput
-    ax1 = axes[0]
-    bars1 = ax1.bar(x_pos, total_throughputs, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
-    ax1.set_ylabel('Total Throughput (Mbps)', fontsize=11, fontweight='bold')
-    ax1.set_title('Total Throughput', fontsize=12, fontweight='bold')
-    ax1.set_xticks(x_pos)
-    ax1.set_xticklabels([f'TCP {v}' for v in variants], fontsize=10)
-    ax1.grid(True, alpha=0.3, axis='y')
-    
-    for bar, value in zip(bars1, total_throughputs):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{value:.2f}',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    # Plot 2: Average Delay
-    ax2 = axes[1]
-    bars2 = ax2.bar(x_pos, delays, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
-    ax2.set_ylabel('Average Delay (ms)', fontsize=11, fontweight='bold')
-    ax2.set_title('Average Delay', fontsize=12, fontweight='bold')
-    ax2.set_xticks(x_pos)
-    ax2.set_xticklabels([f'TCP {v}' for v in variants], fontsize=10)
-    ax2.grid(True, alpha=0.3, axis='y')
-    
-    for bar, value in zip(bars2, delays):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{value:.1f}',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    # Plot 3: Packet Loss Rate
-    ax3 = axes[2]
-    bars3 = ax3.bar(x_pos, loss_rates, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
-    ax3.set_ylabel('Packet Loss Rate (%)', fontsize=11, fontweight='bold')
-    ax3.set_title('Packet Loss Rate', fontsize=12, fontweight='bold')
-    ax3.set_xticks(x_pos)
-    ax3.set_xticklabels([f'TCP {v}' for v in variants], fontsize=10)
-    ax3.grid(True, alpha=0.3, axis='y')
-    
-    for bar, value in zip(bars3, loss_rates):
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{value:.2f}',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    plt.tight_layout()
+    tick_labels = [f'TCP {v}' for v in variants]
+    
+    _bar_panel(axes[0], x_pos, total_throughputs, bar_colors, tick_labels,
+               'Total Throughput (Mbps)', 'Total Throughput', '%.2f')
+    _bar_panel(axes[1], x_pos, delays, bar_colors, tick_labels,
+               'Average Delay (ms)', 'Average Delay', '%.1f')
+    _bar_panel(axes[2], x_pos, loss_rates, bar_colors, tick_labels,
+               'Packet Loss Rate (%)', 'Packet Loss Rate', '%.2f')
+    
+    fig.subplots_adjust(left=0.06, right=0.98, bottom=0.10, top=0.85, wspace=0.3)
     
     # Save plot
-    plot_file = os.path.join(NS3_ROOT, OUTPUT_DIR, "tcp_comparison_aggregate.png")
-    plt.savefig(plot_file, dpi=300, bbox_inches='tight')
+    plot_file = f"{OUT_PREFIX}/tcp_comparison_aggregate.png"
+    fig.savefig(plot_file, dpi=PLOT_DPI, pil_kwargs=PNG_PIL_KWARGS)
     print(f"✓ Saved aggregate comparison: {plot_file}")
     plt.close()
 
@@ -347,16 +347,17 @@ def print_summary(results):
     # Calculate comparisons
     if 'LinuxReno' in results and 'Fast' in results:
         print("\nFAST vs LinuxReno Comparison:")
-        throughput_diff = ((results['Fast']['total_throughput'] - results['LinuxReno']['total_throughput']) / 
-                          results['LinuxReno']['total_throughput'] * 100)
-        delay_diff = ((results['Fast']['avg_delay'] - results['LinuxReno']['avg_delay']) / 
-                     results['LinuxReno']['avg_delay'] * 100)
-        loss_diff = ((results['Fast']['loss_rate'] - results['LinuxReno']['loss_rate']) / 
-                    (results['LinuxReno']['loss_rate'] + 0.001) * 100)
+        metrics = [('Throughput', 'total_throughput'),
+                   ('Delay', 'avg_delay'),
+                   ('Loss Rate', 'loss_rate')]
+        keys = [key for _, key in metrics]
+        fast = np.array([results['Fast'][k] for k in keys])
+        reno = np.array([results['LinuxReno'][k] for k in keys])
+        # A zero baseline has no meaningful relative change; it is left as nan
+        diffs = (fast - reno) / np.where(reno == 0, np.nan, reno) * 100
         
-        print(f"  Throughput: {throughput_diff:+.1f}%")
-        print(f"  Delay: {delay_diff:+.1f}%")
-        print(f"  Loss Rate: {loss_diff:+.1f}%")
+        for (label, _), diff in zip(metrics, diffs):
+            print(f"  {label}: {'n/a' if np.isnan(diff) else f'{diff:+.1f}%'}")
     
     print()
 
@@ -366,6 +367,7 @@ def main():
     
     parser = argparse.ArgumentParser(description='Run fanout topology TCP simulations')
     parser.add_argument('--skip-sim', action='store_true', help='Skip simulation, only plot existing results')
+    parser.add_argument('--no-plot', action='store_true', help='Only print the summary, do not generate plots')
     args = parser.parse_args()
     
     print("="*90)
@@ -380,10 +382,13 @@ def main():
         print("\nSTEP 1: Running Simulations")
         print("="*90)
         
+        # The variants are independent single-threaded runs, so simulate
+        # them concurrently once the shared build is up to date
         success_count = 0
-        for variant in TCP_VARIANTS:
-            if run_simulation(variant, SIMULATION_TIME):
-                success_count += 1
+        if build_simulation():
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(TCP_VARIANTS)) as ex:
+                success_count = sum(ex.map(lambda v: run_simulation(v, SIMULATION_TIME),
+                                           TCP_VARIANTS))
         
         print("\n" + "="*90)
         print(f"Simulation Summary: {success_count}/{len(TCP_VARIANTS)} completed")
@@ -392,11 +397,14 @@ def main():
     print("\nSTEP 2: Loading Results")
     print("="*90)
     
+    # One directory scan instead of a stat() per expected result file
+    existing = {e.name for e in os.scandir(OUT_PREFIX)}
+    
     # Collect aggregate results
     results = {}
     for variant in TCP_VARIANTS:
-        csv_file = os.path.join(NS3_ROOT, OUTPUT_DIR, f"{variant}_fanout.csv")
-        if os.path.exists(csv_file):
+        csv_file = f"{OUT_PREFIX}/{variant}_fanout.csv"
+        if f"{variant}_fanout.csv" in existing:
             data = parse_csv(csv_file)
             if data:
                 results[variant] = data
@@ -407,10 +415,10 @@ def main():
     # Collect per-flow results
     perflow_data = {}
     for variant in TCP_VARIANTS:
-        perflow_file = os.path.join(NS3_ROOT, OUTPUT_DIR, f"{variant}_perflow.csv")
-        if os.path.exists(perflow_file):
+        perflow_file = f"{OUT_PREFIX}/{variant}_perflow.csv"
+        if f"{variant}_perflow.csv" in existing:
             flows = parse_perflow_csv(perflow_file)
-            if flows:
+            if flows is not None and not flows.empty:
                 perflow_data[variant] = flows
                 print(f"✓ Loaded {variant} per-flow results ({len(flows)} flows)")
         else:
@@ -424,7 +432,7 @@ def main():
     print_summary(results)
     
     # Generate plots
-    if HAS_MATPLOTLIB:
+    if not args.no_plot and load_matplotlib():
         print("\nSTEP 3: Generating Plots")
         print("="*90)
         
@@ -433,7 +441,7 @@ def main():
         if perflow_data:
             generate_perflow_comparison_plots(perflow_data)
         
-        generate_cwnd_plots(list(results.keys()))
+        generate_cwnd_plots(list(results.keys()), existing)
     
     print("\n" + "="*90)
     print("✓ Done! Check results/og-sim-2/ for CSV files and plots")
@@ -0,0 +1,39 @@
+"""
+Plotting helpers shared by the results/*/run_and_plot.py scripts
+"""
+
+import numpy as np
+
+MAX_PLOT_POINTS = 4000  # Beyond this a trace has more vertices than pixels
+
+def setup_matplotlib(interactive=False):
+    """Import and return pyplot, configured for long cwnd line plots
+
+    Unless interactive, the Agg backend is selected since the plots are only
+    written to PNG. Path simplification lets Agg drop near-collinear vertices
+    and the chunksize splits long polylines into bounded Agg paths. Raises
+    ImportError if matplotlib is not installed.
+    """
+    import matplotlib
+    if not interactive:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+    return plt
+
+def decimate_trace(times, values, max_points=MAX_PLOT_POINTS):
+    """Min/max-decimate a trace to about max_points samples for plotting"""
+    n = len(times)
+    stride = 2 * n // max_points  # Each bucket keeps its min and its max
+    if stride < 2:
+        return times, values
+
+    m = n // stride * stride
+    buckets = values[:m].reshape(-1, stride)
+    picks = np.sort(np.stack([buckets.argmin(axis=1), buckets.argmax(axis=1)], axis=1),
+                    axis=1)
+    picks += np.arange(0, m, stride)[:, None]
+    picks = np.concatenate([picks.ravel(), np.arange(m, n)])
+    return times[picks], values[picks]
@@ -1,53 +1,58 @@
+import argparse
 import subprocess
-import matplotlib.pyplot as plt
+import numpy as np
 import os
+import re
+import sys
 import time
 
+# Shared plotting helpers live in results/, one level up from this script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from plot_common import setup_matplotlib
+
+plt = None  # pyplot, imported by setup_matplotlib() once the backend is known
+
+LOG_FILE = "results/reno-equilibrium/ns3.log"
+
+# A valid trace line is exactly "<float time> <integer cwnd>"; anything else
+# (extra fields, fractional or non-numeric cwnd) is skipped
+CWND_LINE = re.compile(
+    r'^[ \t]*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)[ \t]+([-+]?\d+)[ \t]*\r?$',
+    re.MULTILINE)
+
 def run_ns3_simulation():
     print("Running ns-3 simulation...")
     start_time = time.time()
     
-    result = subprocess.run(
-        ["./ns3", "run", "reno-equilibrium"],
-        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-    )
+    # Stream ns-3 output to a log file rather than buffering it all in memory
+    with open(LOG_FILE, 'w') as log:
+        result = subprocess.run(
+            ["./ns3", "run", "reno-equilibrium"],
+            stdout=log, stderr=subprocess.STDOUT
+        )
 
     elapsed_time = time.time() - start_time
 
     if result.returncode != 0:
-        print("Error running simulation:")
-        print(result.stderr)
+        print(f"Error running simulation (see {LOG_FILE}):")
+        with open(LOG_FILE) as log:
+            print(''.join(log.readlines()[-20:]))
         exit(1)
 
-    print(result.stdout)
+    print(f"Simulation output written to: {LOG_FILE}")
     return elapsed_time
 
 
 def parse_cwnd_file(filename):
-    times = []
-    cwnds = []
-
     if not os.path.exists(filename):
         print(f"Error: File {filename} not found!")
         exit(1)
 
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            try:
-                t, cwnd = line.split()
-                times.append(float(t))
-                cwnds.append(int(cwnd))
-            except ValueError:
-                continue
-
-    return times, cwnds
+    data = np.fromregex(filename, CWND_LINE, [('t', np.float64), ('c', np.int64)])
+    return data['t'], data['c']
 
 
-def plot_cwnd(times, cwnds):
+def plot_cwnd(times, cwnds, interactive=False):
     plt.figure(figsize=(12, 6))
     plt.plot(times, cwnds, linewidth=1.2, color='blue')
     plt.title("TCP Fast Congestion Window Evolution", fontsize=14, fontweight='bold')
@@ -61,10 +66,18 @@ def plot_cwnd(times, cwnds):
     plt.savefig(output_file, dpi=150, bbox_inches='tight')
     print(f"Plot saved to: {output_file}")
     
-    plt.show()
+    if interactive:
+        plt.show()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run reno-equilibrium and plot its cwnd trace')
+    parser.add_argument('--interactive', action='store_true',
+                        help='Show the plot window after saving it')
+    args = parser.parse_args()
+
+    plt = setup_matplotlib(interactive=args.interactive)
+
     # Run simulation
     sim_time = run_ns3_simulation()
     
@@ -75,6 +88,6 @@ if __name__ == "__main__":
     print(f"Simulation time: {sim_time:.2f} seconds")
     print("Plotting...")
 
-    plot_cwnd(times, cwnds)
+    plot_cwnd(times, cwnds, interactive=args.interactive)
     
     print(f"\nTotal runtime: {sim_time:.2f} seconds")
@@ -4,101 +4,178 @@ Script to run TCP variant simulations and compare results from multi-RTT bottlen
 Generates plots for throughput, delay, and congestion window comparisons
 """
 
-import csv
+import concurrent.futures
+import functools
 import sys
 import os
 import subprocess
-import matplotlib.pyplot as plt
+import warnings
 import numpy as np
+import pandas as pd
 
 # Get the ns-3 root directory (2 levels up from this script)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 NS3_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
 
+# Shared plotting helpers live in results/, one level up from this script
+sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+from plot_common import decimate_trace, setup_matplotlib
+
+plt = setup_matplotlib()
+
+PLOT_DPI = 150  # Plenty for comparison PNGs; pixel count (and Agg time) goes as dpi^2
+MAX_BAR_LABELS = 40  # Above this many bars, value labels just overlap
+
+# Columns read from <variant>_results.csv and the keys they are exposed under
+RESULT_COLUMNS = {
+    'Flow_ID': 'flow_id',
+    'RTT_ms': 'rtt_ms',
+    'Throughput_Mbps': 'throughput',
+    'Data_Received_MB': 'data_mb',
+    'Avg_Delay_ms': 'avg_delay',
+    'Loss_Rate_Percent': 'loss_rate',
+}
+RESULT_DTYPES = {
+    'Flow_ID': 'int32',
+    'RTT_ms': 'int32',
+    'Throughput_Mbps': 'float64',
+    'Data_Received_MB': 'float64',
+    'Avg_Delay_ms': 'float64',
+    'Loss_Rate_Percent': 'float64',
+}
+
+def build_simulation():
+    """Build the simulation once so parallel runs don't race on the build tree"""
+    try:
+        subprocess.run(['./ns3', 'build', 'tcp-multi-rtt-bottleneck'], cwd=NS3_ROOT, check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print("\n✗ Error building simulation:")
+        print(f"  {e}")
+        return False
+
 def run_simulation(variant):
     """Run ns-3 simulation for a given TCP variant"""
     print(f"\n{'='*80}")
     print(f"Running simulation for {variant}...")
     print(f"{'='*80}\n")
     
-    # Change to ns-3 root directory
-    os.chdir(NS3_ROOT)
-    
-    # Run the simulation
+    # Run the simulation; program arguments follow '--' as separate entries
     cmd = [
-        './ns3', 'run',
-        f'tcp-multi-rtt-bottleneck --tcpVariant={variant}'
+        './ns3', 'run', '--no-build', 'tcp-multi-rtt-bottleneck',
+        '--', f'--tcpVariant={variant}'
     ]
     
+    # Send ns-3 output to a per-variant log so concurrent runs don't
+    # interleave on the terminal
+    log_file = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', f"{variant}.log")
+    
     try:
-        result = subprocess.run(cmd, check=True, capture_output=False, text=True)
+        with open(log_file, 'wb') as logf:
+            subprocess.run(cmd, cwd=NS3_ROOT, check=True,
+                           stdout=logf, stderr=subprocess.STDOUT)
         print(f"\n {variant} simulation completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"\n✗ Error running {variant} simulation:")
         print(f"  {e}")
+        print(f"  See {log_file} for the simulation output")
         return False
 
 def read_results(variant):
-    """Read results for a given TCP variant"""
+    """Read results for a given TCP variant
+
+    Returns a dict mapping each RESULT_COLUMNS key to a numpy array with one
+    entry per flow, or None if the file is missing. The parsed columns are
+    cached in a .npz next to the CSV and reused while it is not older than
+    the CSV, so --skip-sim reruns skip the CSV parse.
+    """
     filename = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', f"{variant}_results.csv")
+    cache_file = os.path.splitext(filename)[0] + '.npz'
     
     if not os.path.exists(filename):
         print(f"Warning: {filename} not found")
         return None
     
-    flows = []
-    with open(filename, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            flows.append({
-                'flow_id': int(row['Flow_ID']),
-                'rtt_ms': int(row['RTT_ms']),
-                'throughput': float(row['Throughput_Mbps']),
-                'data_mb': float(row['Data_Received_MB']),
-                'avg_delay': float(row['Avg_Delay_ms']),
-                'loss_rate': float(row['Loss_Rate_Percent'])
-            })
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(filename):
+        with np.load(cache_file) as cached:
+            if set(cached.files) == set(RESULT_COLUMNS.values()):
+                return {key: cached[key] for key in cached.files}
     
+    df = pd.read_csv(filename, usecols=list(RESULT_COLUMNS), dtype=RESULT_DTYPES)
+    flows = {key: df[col].to_numpy() for col, key in RESULT_COLUMNS.items()}
+    np.savez(cache_file, **flows)
     return flows
 
-def read_cwnd_data(variant, flow_id):
-    """Read congestion window data for a given variant and flow"""
-    filename = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', 
-                           f"{variant}_flow{flow_id}_cwnd.dat")
+def _load_cwnd_trace(variant, flow_id):
+    """Load a cwnd .dat trace as an (N, 2) float32 array, or None if unusable
+
+    The parsed trace is also saved next to the .dat as .npy. While that copy
+    is not older than the .dat it is memory-mapped instead of reparsing text.
+    """
+    base = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', 
+                        f"{variant}_flow{flow_id}_cwnd")
+    dat_file = base + '.dat'
+    npy_file = base + '.npy'
+    
+    # The .dat is authoritative: a leftover .npy from an earlier run must not
+    # stand in for a trace this run did not produce
+    if not os.path.exists(dat_file):
+        print(f"Warning: {dat_file} not found")
+        return None
     
-    if not os.path.exists(filename):
-        print(f"Warning: {filename} not found")
-        return None, None
+    if os.path.exists(npy_file) and os.path.getmtime(npy_file) >= os.path.getmtime(dat_file):
+        data = np.load(npy_file, mmap_mode='r')
+        if data.ndim == 2 and data.shape[1] == 2:
+            return data
+    
+    try:
+        with warnings.catch_warnings():
+            # A trace with only its header line is valid, just empty
+            warnings.simplefilter('ignore', UserWarning)
+            data = np.loadtxt(dat_file, comments='#', dtype=np.float32, ndmin=2)
+    except ValueError as e:
+        print(f"Warning: could not parse {dat_file}: {e}")
+        return None
     
-    times = []
-    cwnds = []
+    if data.size == 0:
+        data = np.empty((0, 2), dtype=np.float32)
+    elif data.shape[1] < 2:
+        print(f"Warning: {dat_file} has no cwnd column")
+        return None
     
-    with open(filename, 'r') as f:
-        for line in f:
-            if line.startswith('#'):
-                continue
-            parts = line.strip().split()
-            if len(parts) == 2:
-                times.append(float(parts[0]))
-                cwnds.append(float(parts[1]))
+    data = np.ascontiguousarray(data[:, :2])
+    np.save(npy_file, data)
+    return data
+
+@functools.lru_cache(maxsize=32)
+def read_cwnd_data(variant, flow_id):
+    """Read congestion window data for a given variant and flow
+
+    Results are cached per (variant, flow_id).
+    """
+    data = _load_cwnd_trace(variant, flow_id)
+    if data is None:
+        return None, None
     
-    return np.array(times), np.array(cwnds)
+    return data[:, 0], data[:, 1]
 
 def calculate_stats(flows):
-    """Calculate aggregate statistics"""
-    throughputs = [f['throughput'] for f in flows]
-    loss_rates = [f['loss_rate'] for f in flows]
-    
-    total = sum(throughputs)
-    avg = total / len(throughputs)
-    min_tput = min(throughputs)
-    max_tput = max(throughputs)
-    avg_loss = sum(loss_rates) / len(loss_rates) if loss_rates else 0
+    """Calculate aggregate statistics from the per-flow column arrays"""
+    # float64 so the dot product below is a single BLAS ddot call
+    throughputs = np.asarray(flows['throughput'], dtype=np.float64)
+    loss_rates = flows['loss_rate']
+    n = len(throughputs)
+    
+    total = throughputs.sum()
+    avg = total / n
+    min_tput = throughputs.min()
+    max_tput = throughputs.max()
+    avg_loss = loss_rates.mean() if n else 0
     
     # Jain's Fairness Index
-    sum_squared = sum(t * t for t in throughputs)
-    fairness = (total * total) / (len(throughputs) * sum_squared)
+    sum_squared = throughputs @ throughputs
+    fairness = (total * total) / (n * sum_squared)
     
     return {
         'total': total,
@@ -109,164 +186,61 @@ def calculate_stats(flows):
         'avg_loss': avg_loss
     }
 
-def plot_throughput_comparison(all_results, output_file='throughput_comparison.png'):
-    """Generate bar chart comparing throughput across flows and variants"""
+def _plot_metric(ax, all_results, rtt_labels, key, ylabel, title, fmt, output_file):
+    """Draw a bar chart comparing one per-flow metric across variants on ax"""
     variants = list(all_results.keys())
-    num_flows = len(all_results[variants[0]]['flows'])
+    num_flows = len(rtt_labels)
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.clear()
     
     x = np.arange(num_flows)
     width = 0.35
     
-    # Get throughputs for each variant
-    throughputs = {}
-    rtt_labels = []
-    for variant in variants:
-        throughputs[variant] = [all_results[variant]['flows'][i]['throughput'] 
-                                for i in range(num_flows)]
-    
-    rtt_labels = [f"{all_results[variants[0]]['flows'][i]['rtt_ms']}ms" 
-                  for i in range(num_flows)]
+    # (num_variants, num_flows) array of the metric
+    data = np.vstack([all_results[v]['flows'][key] for v in variants])
     
-    # Create bars
+    # Create bars; dense charts skip the per-bar value labels
+    show_labels = data.size <= MAX_BAR_LABELS
     for i, variant in enumerate(variants):
         offset = width * (i - len(variants)/2 + 0.5)
-        bars = ax.bar(x + offset, throughputs[variant], width, label=variant)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}',
-                    ha='center', va='bottom', fontsize=9)
+        bars = ax.bar(x + offset, data[i], width, label=variant)
+        if show_labels:
+            ax.bar_label(bars, fmt=fmt, fontsize=9, padding=1)
     
     ax.set_xlabel('Flow RTT', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Throughput (Mbps)', fontsize=12, fontweight='bold')
-    ax.set_title('Throughput Comparison: TCP Variants Across Different RTTs', 
-                 fontsize=14, fontweight='bold')
+    ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold')
     ax.set_xticks(x)
     ax.set_xticklabels(rtt_labels)
     ax.legend(fontsize=11)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     
-    plt.tight_layout()
+    fig = ax.figure
+    fig.tight_layout()
     output_path = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', output_file)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f" Saved throughput comparison plot: {output_path}")
-    plt.close()
+    fig.savefig(output_path, dpi=PLOT_DPI)
+    print(f" Saved comparison plot: {output_path}")
 
-def plot_delay_comparison(all_results, output_file='delay_comparison.png'):
-    """Generate bar chart comparing average delay across flows and variants"""
-    variants = list(all_results.keys())
-    num_flows = len(all_results[variants[0]]['flows'])
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    x = np.arange(num_flows)
-    width = 0.35
-    
-    # Get delays for each variant
-    delays = {}
-    rtt_labels = []
-    for variant in variants:
-        delays[variant] = [all_results[variant]['flows'][i]['avg_delay'] 
-                          for i in range(num_flows)]
-    
-    rtt_labels = [f"{all_results[variants[0]]['flows'][i]['rtt_ms']}ms" 
-                  for i in range(num_flows)]
-    
-    # Create bars
-    for i, variant in enumerate(variants):
-        offset = width * (i - len(variants)/2 + 0.5)
-        bars = ax.bar(x + offset, delays[variant], width, label=variant)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}',
-                    ha='center', va='bottom', fontsize=9)
-    
-    ax.set_xlabel('Flow RTT', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Average Delay (ms)', fontsize=12, fontweight='bold')
-    ax.set_title('Average Delay Comparison: TCP Variants Across Different RTTs', 
-                 fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(rtt_labels)
-    ax.legend(fontsize=11)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-    
-    plt.tight_layout()
-    output_path = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', output_file)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f" Saved delay comparison plot: {output_path}")
-    plt.close()
+def plot_cwnd_progress(axes, variant, rtts, output_file):
+    """Draw one subplot per flow showing its congestion window progress on axes
 
-def plot_loss_comparison(all_results, output_file='loss_comparison.png'):
-    """Generate bar chart comparing packet loss across flows and variants"""
-    variants = list(all_results.keys())
-    num_flows = len(all_results[variants[0]]['flows'])
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    x = np.arange(num_flows)
-    width = 0.35
-    
-    # Get loss rates for each variant
-    loss_rates = {}
-    rtt_labels = []
-    for variant in variants:
-        loss_rates[variant] = [all_results[variant]['flows'][i]['loss_rate'] 
-                               for i in range(num_flows)]
-    
-    rtt_labels = [f"{all_results[variants[0]]['flows'][i]['rtt_ms']}ms" 
-                  for i in range(num_flows)]
-    
-    # Create bars
-    for i, variant in enumerate(variants):
-        offset = width * (i - len(variants)/2 + 0.5)
-        bars = ax.bar(x + offset, loss_rates[variant], width, label=variant)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}',
-                    ha='center', va='bottom', fontsize=9)
-    
-    ax.set_xlabel('Flow RTT', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Packet Loss Rate (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Packet Loss Rate Comparison: TCP Variants Across Different RTTs', 
-                 fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(rtt_labels)
-    ax.legend(fontsize=11)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-    
-    plt.tight_layout()
-    output_path = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', output_file)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"✓ Saved loss rate comparison plot: {output_path}")
-    plt.close()
-
-def plot_cwnd_progress(variant, num_flows, output_file):
-    """Generate 4 subplots showing congestion window progress for each flow"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    axes must hold at least len(rtts) subplots; any spare ones are hidden.
+    """
+    fig = axes[0].figure
+    for i, ax in enumerate(axes):
+        ax.clear()
+        ax.set_visible(i < len(rtts))
     fig.suptitle(f'Congestion Window Progress: {variant}', 
                  fontsize=16, fontweight='bold')
     
-    axes = axes.flatten()
-    
-    for flow_id in range(num_flows):
+    for flow_id, rtt in enumerate(rtts):
         times, cwnds = read_cwnd_data(variant, flow_id)
         
         if times is not None and len(times) > 0:
             ax = axes[flow_id]
-            ax.plot(times, cwnds, linewidth=1.5, color=f'C{flow_id}')
-            
-            # Get RTT for title
-            rtt = [50, 100, 150, 200][flow_id]  # Default RTT values
+            # Plot a decimated copy; the statistics below use the full trace
+            ax.plot(*decimate_trace(times, cwnds), linewidth=1.5, color=f'C{flow_id}',
+                    rasterized=True)
             
             ax.set_xlabel('Time (s)', fontsize=10, fontweight='bold')
             ax.set_ylabel('Congestion Window (segments)', fontsize=10, fontweight='bold')
@@ -274,9 +248,11 @@ def plot_cwnd_progress(variant, num_flows, output_file):
             ax.grid(True, alpha=0.3, linestyle='--')
             
             # Add statistics
-            if len(cwnds) > 10:
-                avg_cwnd = np.mean(cwnds[int(len(cwnds)*0.1):])  # Exclude initial ramp-up
-                max_cwnd = np.max(cwnds)
+            n = len(cwnds)
+            if n > 10:
+                tail = cwnds[int(n*0.1):]  # Exclude initial ramp-up; a view, not a copy
+                avg_cwnd = tail.sum() / tail.size
+                max_cwnd = cwnds.max()
                 ax.text(0.98, 0.95, f'Avg: {avg_cwnd:.1f}\nMax: {max_cwnd:.1f}',
                        transform=ax.transAxes, fontsize=9,
                        verticalalignment='top', horizontalalignment='right',
@@ -285,33 +261,44 @@ def plot_cwnd_progress(variant, num_flows, output_file):
             axes[flow_id].text(0.5, 0.5, 'No data available',
                               ha='center', va='center', fontsize=12)
     
-    plt.tight_layout()
+    fig.tight_layout()
     output_path = os.path.join(NS3_ROOT, 'results', 'tcp-multi-rtt', output_file)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(output_path, dpi=PLOT_DPI)
     print(f" Saved CWND progress plot: {output_path}")
-    plt.close()
 
 def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Run multi-RTT bottleneck TCP simulations')
+    parser.add_argument('--skip-sim', action='store_true',
+                        help='Skip simulation, only analyse and plot existing results')
+    args = parser.parse_args()
+    
     variants = ['TcpLinuxReno', 'TcpFast']
     
     print("\n" + "="*80)
     print("TCP VARIANT COMPARISON - Multi-RTT Bottleneck Scenario")
     print("="*80)
-    print("\nSTEP 1: Running Simulations")
-    print("="*80)
     
-    # Run simulations for each variant
-    simulation_success = {}
-    for variant in variants:
-        success = run_simulation(variant)
-        simulation_success[variant] = success
-        if not success:
-            print(f"\n✗ Failed to run simulation for {variant}")
-    
-    # Check if all simulations completed
-    if not all(simulation_success.values()):
-        print("\n✗ Some simulations failed. Exiting.")
-        return 1
+    if not args.skip_sim:
+        print("\nSTEP 1: Running Simulations")
+        print("="*80)
+        
+        if not build_simulation():
+            return 1
+        
+        # Run simulations for each variant concurrently; each ns-3 run is an
+        # independent single-threaded process
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(variants)) as ex:
+            simulation_success = dict(zip(variants, ex.map(run_simulation, variants)))
+        for variant, success in simulation_success.items():
+            if not success:
+                print(f"\n✗ Failed to run simulation for {variant}")
+        
+        # Check if all simulations completed
+        if not all(simulation_success.values()):
+            print("\n✗ Some simulations failed. Exiting.")
+            return 1
     
     print("\n" + "="*80)
     print("STEP 2: Loading Results and Generating Analysis")
@@ -321,7 +308,7 @@ def main():
     all_results = {}
     for variant in variants:
         flows = read_results(variant)
-        if flows:
+        if flows is not None and len(flows['flow_id']):
             all_results[variant] = {
                 'flows': flows,
                 'stats': calculate_stats(flows)
@@ -331,107 +318,42 @@ def main():
         print("No results found. Check simulation output.")
         return 1
     
-    # Print per-flow comparison
-    print("\nPER-FLOW THROUGHPUT COMPARISON (Mbps):")
-    print("-" * 80)
-    
-    # Get number of flows from first result
-    num_flows = len(list(all_results.values())[0]['flows'])
-    
-    # Header
-    header = f"{'RTT (ms)':<12}"
-    for variant in variants:
-        if variant in all_results:
-            header += f"{variant:<20}"
-    print(header)
-    print("-" * 80)
-    
-    # Per-flow data
-    for i in range(num_flows):
-        rtt = list(all_results.values())[0]['flows'][i]['rtt_ms']
-        line = f"{rtt:<12}"
-        
-        for variant in variants:
-            if variant in all_results:
-                throughput = all_results[variant]['flows'][i]['throughput']
-                line += f"{throughput:<20.2f}"
-        
-        print(line)
-    
-    # Print loss rate comparison
-    print("\nPER-FLOW PACKET LOSS RATE (%):")
-    print("-" * 80)
-    
-    header = f"{'RTT (ms)':<12}"
-    for variant in variants:
-        if variant in all_results:
-            header += f"{variant:<20}"
-    print(header)
-    print("-" * 80)
-    
-    for i in range(num_flows):
-        rtt = list(all_results.values())[0]['flows'][i]['rtt_ms']
-        line = f"{rtt:<12}"
-        
-        for variant in variants:
-            if variant in all_results:
-                loss = all_results[variant]['flows'][i]['loss_rate']
-                line += f"{loss:<20.2f}"
-        
-        print(line)
-    
-    # Print delay comparison
-    print("\nPER-FLOW AVERAGE DELAY COMPARISON (ms):")
-    print("-" * 80)
-    
-    header = f"{'RTT (ms)':<12}"
-    for variant in variants:
-        if variant in all_results:
-            header += f"{variant:<20}"
-    print(header)
-    print("-" * 80)
-    
-    for i in range(num_flows):
-        rtt = list(all_results.values())[0]['flows'][i]['rtt_ms']
-        line = f"{rtt:<12}"
-        
-        for variant in variants:
-            if variant in all_results:
-                delay = all_results[variant]['flows'][i]['avg_delay']
-                line += f"{delay:<20.2f}"
-        
-        print(line)
+    # Every variant runs the same flow layout, so take the per-flow RTTs from
+    # the first loaded result once instead of re-deriving them per row/plot
+    flows_by_variant = {v: all_results[v]['flows'] for v in all_results}
+    first_flows = next(iter(flows_by_variant.values()))
+    rtts = first_flows['rtt_ms']
+    rtt_labels = [f"{rtt}ms" for rtt in rtts]
+    
+    # Per-flow comparison tables: one column per variant, one row per RTT
+    for title, key in [('PER-FLOW THROUGHPUT COMPARISON (Mbps)', 'throughput'),
+                       ('PER-FLOW PACKET LOSS RATE (%)', 'loss_rate'),
+                       ('PER-FLOW AVERAGE DELAY COMPARISON (ms)', 'avg_delay')]:
+        table = pd.DataFrame({'RTT (ms)': rtts,
+                              **{v: flows[key] for v, flows in flows_by_variant.items()}})
+        print(f"\n{title}:")
+        print("-" * 80)
+        print(table.to_string(index=False, float_format='{:.2f}'.format, col_space=12))
     
     # Print aggregate statistics
     print("\n" + "="*80)
     print("AGGREGATE STATISTICS:")
-    print("="*80)
-    
-    print(f"\n{'Metric':<25}", end="")
-    for variant in variants:
-        if variant in all_results:
-            print(f"{variant:<20}", end="")
-    print()
-    print("-" * 80)
+    print("="*80 + "\n")
     
     metrics = [
-        ('Total Throughput (Mbps)', 'total'),
-        ('Average Throughput (Mbps)', 'avg'),
-        ('Min Throughput (Mbps)', 'min'),
-        ('Max Throughput (Mbps)', 'max'),
-        ('Fairness Index (Jain)', 'fairness')
+        ('Total Throughput (Mbps)', 'total', '{:.2f}'),
+        ('Average Throughput (Mbps)', 'avg', '{:.2f}'),
+        ('Min Throughput (Mbps)', 'min', '{:.2f}'),
+        ('Max Throughput (Mbps)', 'max', '{:.2f}'),
+        ('Fairness Index (Jain)', 'fairness', '{:.4f}')
     ]
     
-    for metric_name, metric_key in metrics:
-        print(f"{metric_name:<25}", end="")
-        for variant in variants:
-            if variant in all_results:
-                value = all_results[variant]['stats'][metric_key]
-                if metric_key == 'fairness':
-                    print(f"{value:<20.4f}", end="")
-                else:
-                    print(f"{value:<20.2f}", end="")
-        print()
+    # Values are pre-formatted since precision differs per row
+    stats_table = pd.DataFrame(
+        {v: [fmt.format(r['stats'][key]) for _, key, fmt in metrics]
+         for v, r in all_results.items()},
+        index=[name for name, _, _ in metrics])
+    print(stats_table.to_string(col_space=12))
     
     # Analysis summary
     print("\n" + "="*80)
@@ -455,8 +377,8 @@ def main():
     for variant in variants:
         if variant in all_results:
             flows = all_results[variant]['flows']
-            low_rtt_tput = flows[0]['throughput']  # 50ms flow
-            high_rtt_tput = flows[-1]['throughput']  # 200ms flow
+            low_rtt_tput = flows['throughput'][0]  # 50ms flow
+            high_rtt_tput = flows['throughput'][-1]  # 200ms flow
             bias = low_rtt_tput / high_rtt_tput if high_rtt_tput > 0 else float('inf')
             print(f"  {variant}: {bias:.2f}x (50ms={low_rtt_tput:.2f} Mbps, 200ms={high_rtt_tput:.2f} Mbps)")
     
@@ -465,20 +387,37 @@ def main():
     print("STEP 3: GENERATING PLOTS")
     print("="*80 + "\n")
     
+    # One figure is reused for all three bar charts; only the axes contents change
+    fig, ax = plt.subplots(figsize=(12, 6))
+    
     # 1. Throughput comparison bar chart
-    plot_throughput_comparison(all_results, 'throughput_comparison.png')
+    _plot_metric(ax, all_results, rtt_labels, 'throughput', 'Throughput (Mbps)',
+                 'Throughput Comparison: TCP Variants Across Different RTTs',
+                 '%.1f', 'throughput_comparison.png')
     
     # 2. Delay comparison bar chart
-    plot_delay_comparison(all_results, 'delay_comparison.png')
+    _plot_metric(ax, all_results, rtt_labels, 'avg_delay', 'Average Delay (ms)',
+                 'Average Delay Comparison: TCP Variants Across Different RTTs',
+                 '%.1f', 'delay_comparison.png')
     
     # 3. Packet loss comparison bar chart
-    plot_loss_comparison(all_results, 'loss_comparison.png')
-    
-    # 4. Congestion window progress plots (one per variant)
+    _plot_metric(ax, all_results, rtt_labels, 'loss_rate', 'Packet Loss Rate (%)',
+                 'Packet Loss Rate Comparison: TCP Variants Across Different RTTs',
+                 '%.2f', 'loss_comparison.png')
+    plt.close(fig)
+    
+    # 4. Congestion window progress plots (one per variant, same figure).
+    # Two subplots per row, enough rows for the variant with the most flows
+    max_flows = max(len(flows['rtt_ms']) for flows in flows_by_variant.values())
+    rows = (max_flows + 1) // 2
+    fig, axes = plt.subplots(rows, 2, figsize=(14, 5 * rows), squeeze=False)
+    axes = axes.flatten()
     for variant in variants:
         if variant in all_results:
             output_file = f'{variant}_cwnd_progress.png'
-            plot_cwnd_progress(variant, num_flows, output_file)
+            plot_cwnd_progress(axes, variant, flows_by_variant[variant]['rtt_ms'],
+                               output_file)
+    plt.close(fig)
     
     print("\n" + "="*80)
     print(" All simulations completed and plots generated successfully!")